@@ -0,0 +1,58 @@
+import re
+
+def _build_trie(keys) -> dict:
+    """Build a character trie of the given keys; the '' entry marks a key end."""
+    root = {}
+    for key in keys:
+        node = root
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[""] = None
+    return root
+
+def _trie_to_regex(node: dict) -> str:
+    """Render a trie as a regex where shared prefixes are factored out.
+
+    Every branch point is an alternation over distinct next characters, so the
+    regex engine never retries the same prefix for a different key. A key that
+    ends where longer keys continue becomes an optional suffix, which makes the
+    greedy engine prefer the longest key at each position.
+    """
+    branches = []
+    chars = []
+    for ch, child in node.items():
+        if not ch:
+            continue
+        if len(child) == 1 and "" in child:
+            chars.append(re.escape(ch))
+            continue
+        prefix = re.escape(ch)
+        # Collapse single-child chains iteratively so long keys don't recurse.
+        while len(child) == 1 and "" not in child:
+            (ch, child), = child.items()
+            prefix += re.escape(ch)
+        branches.append(prefix + _trie_to_regex(child))
+    if len(chars) == 1:
+        branches.append(chars[0])
+    elif chars:
+        branches.append("[" + "".join(chars) + "]")
+    if not branches:
+        return ""
+    if "" not in node:
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return "(?:" + "|".join(branches) + ")?"
+
+def _compile_trie(keys) -> "re.Pattern":
+    """Compile a pattern matching any key, preferring the longest at each position.
+
+    Keys are sorted first so the same key set always yields the same pattern,
+    whatever order the caller supplied them in. Callers cache the result.
+    """
+    keys = sorted(keys)
+    try:
+        return re.compile(_trie_to_regex(_build_trie(keys)))
+    except RecursionError:
+        # Deeply nested tries exceed the regex parser's recursion; a flat
+        # alternation sorted longest-first has the same matching semantics.
+        ordered = sorted(keys, key=len, reverse=True)
+        return re.compile("|".join(map(re.escape, ordered)))
@@ -1,5 +1,20 @@
 import re
-
+from functools import lru_cache
+
+# Zero-width match at every word boundary: an uppercase letter preceded by a
+# lowercase letter/digit, or an uppercase letter starting a capitalized word.
+_SNAKE_BOUNDARY = re.compile(r'(?<=.)(?=[A-Z])(?:(?<=[a-z0-9])|(?=.[a-z]))')
+_SEP_SPLIT = re.compile(r'[_\-\s]')
+# bytes.translate table mapping every ASCII byte _SEP_SPLIT matches to a space.
+_SEP_TABLE = bytes(32 if chr(c) in '_-\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f ' else c for c in range(256))
+
+def _split_words(s: str) -> list:
+    """Split s on separators exactly like _SEP_SPLIT.split, without the regex for ASCII."""
+    if s.isascii():
+        return s.encode("ascii").translate(_SEP_TABLE).decode("ascii").split(" ")
+    return _SEP_SPLIT.split(s)
+
+@lru_cache(maxsize=4096)
 def to_snake(s: str) -> str:
     """Convert a string to snake_case format.
 
@@ -23,16 +38,35 @@ def to_snake(s: str) -> str:
         - Empty string returns an empty string.
         - Non-ASCII characters are preserved but not affected by case conversion.
     """
-    s = re.sub(r'(.)([A-Z][a-z]+)', r'\1_\2', s)
-    s = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', s)
-    return s.replace(" ", "_").lower()
+    return _SNAKE_BOUNDARY.sub('_', s).replace(" ", "_").lower()
+
+def to_snake_batch(strings) -> list:
+    """Convert every string in an iterable to snake_case format.
+
+    Equivalent to calling to_snake on each item, and shares its LRU cache, so
+    repeated names in a batch are only converted once.
+
+    Args:
+        strings: An iterable of strings to convert.
+
+    Returns:
+        A list with each input converted to snake_case, in input order.
+
+    Raises:
+        TypeError: If strings is not iterable.
+
+    Edge cases:
+        - Empty iterable returns an empty list.
+    """
+    return list(map(to_snake, strings))
 
+@lru_cache(maxsize=4096)
 def to_camel(s: str) -> str:
     """Convert a string to camelCase format.
 
     Converts various string formats (snake_case, kebab-case, PascalCase, etc.)
     to camelCase where the first word is lowercase and subsequent words are
-    title-cased without separators.
+    capitalized without separators.
 
     Args:
         s: The input string to convert.
@@ -48,16 +82,19 @@ def to_camel(s: str) -> str:
         - Empty string returns an empty string.
         - String with only separators returns an empty string.
         - Single word returns the word in lowercase.
+        - Only the first letter of each word is uppercased; letters after digits
+          or apostrophes inside a word stay lowercase (e.g. "get_v2api" -> "getV2api").
         - Separators recognized: underscores (_), hyphens (-), and spaces ( ).
     """
-    parts = re.split(r'[_\-\s]', s)
-    return parts[0].lower() + "".join(p.title() for p in parts[1:])
+    parts = _split_words(s)
+    return parts[0].lower() + "".join(map(str.capitalize, parts[1:]))
 
+@lru_cache(maxsize=4096)
 def to_pascal(s: str) -> str:
     """Convert a string to PascalCase format.
 
     Converts various string formats (snake_case, kebab-case, camelCase, etc.)
-    to PascalCase where each word is title-cased and concatenated without
+    to PascalCase where each word is capitalized and concatenated without
     separators.
 
     Args:
@@ -74,11 +111,14 @@ def to_pascal(s: str) -> str:
         - Empty string returns an empty string.
         - String with only separators returns an empty string.
         - Single word returns the word with first character capitalized.
+        - Only the first letter of each word is uppercased; letters after digits
+          or apostrophes inside a word stay lowercase (e.g. "v2api" -> "V2api").
         - Separators recognized: underscores (_), hyphens (-), and spaces ( ).
     """
-    parts = re.split(r'[_\-\s]', s)
-    return "".join(p.title() for p in parts)
+    parts = _split_words(s)
+    return "".join(map(str.capitalize, parts))
 
+@lru_cache(maxsize=4096)
 def to_kebab(s: str) -> str:
     """Convert a string to kebab-case format.
 
@@ -8,9 +8,40 @@ EMOJI_PATTERN = re.compile(
     "\U0001F300-\U0001F5FF"
     "\U0001F680-\U0001F6FF"
     "\U0001F1E0-\U0001F1FF"
-    "]+", flags=re.UNICODE
+    "]+"
 )
 
+def _has_astral(s: str) -> bool:
+    """Return True if s contains a code point above U+FFFF.
+
+    Every EMOJI_PATTERN range lies above the BMP. Such characters take two
+    UTF-16 code units, so comparing the encoded length answers in a single
+    C-level pass, far cheaper than running the regex.
+    """
+    return len(s.encode("utf-16-le", "surrogatepass")) != 2 * len(s)
+
+# Comments are matched whole (they may span lines and contain '>'), and an
+# unterminated comment runs to the end of input as in HTML parsers, which keeps
+# the scan linear; any other tag runs to the first '>' on its line.
+_TAG_RE = re.compile(r'<!--.*?(?:-->|\Z)|<[^>\n]*>', re.DOTALL)
+
+# The entities that dominate scraped text; anything else goes to html.unescape.
+_COMMON_ENTITY_RE = re.compile(r'&(?:lt|gt|quot|nbsp|amp);')
+
+def _unescape(s: str) -> str:
+    """Unescape HTML entities, with a str.replace fast path for common ones.
+
+    When every '&' in s starts one of the common entities, a chain of C-level
+    replaces gives the same result as html.unescape. '&amp;' is replaced last so
+    its output is never decoded a second time.
+    """
+    if s.count('&') != len(_COMMON_ENTITY_RE.findall(s)):
+        return html.unescape(s)
+    return (s.replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"')
+            .replace('&nbsp;', '\xa0').replace('&amp;', '&'))
+
+_FORMS = frozenset(("NFC", "NFKC", "NFD", "NFKD"))
+
 def remove_html(s: str) -> str:
     """Remove all HTML tags from a string.
 
@@ -29,10 +60,17 @@ def remove_html(s: str) -> str:
     Edge cases:
         - Empty string returns an empty string.
         - String with no HTML tags returns the original string unchanged.
-        - Malformed tags are handled by the greedy regex pattern.
+        - A tag runs from '<' to the first '>' on the same line; a '<' with no
+          closing '>' before the line ends is kept as text.
+        - HTML comments (<!-- ... -->) are removed whole, even across lines or
+          when they contain '>'.
+        - A '<!--' with no closing '-->' removes everything after it, as HTML
+          parsers treat the rest of the document as comment.
         - HTML entities (e.g., &lt;) are NOT unescaped; use html.unescape separately.
     """
-    return re.sub(r'<.*?>', '', s)
+    if '<' not in s:
+        return s
+    return _TAG_RE.sub('', s)
 
 def remove_emoji(s: str) -> str:
     """Remove all emoji characters from a string.
@@ -54,7 +92,11 @@ def remove_emoji(s: str) -> str:
         - String with no emoji returns the original string unchanged.
         - Emoji in skin tone or zero-width-joiner sequences may not all be removed.
         - Non-emoji Unicode characters are preserved.
+        - Strings without astral-plane characters (which includes all ASCII)
+          cannot contain emoji and skip the regex scan.
     """
+    if s.isascii() or not _has_astral(s):
+        return s
     return EMOJI_PATTERN.sub('', s)
 
 def normalize_spaces(s: str) -> str:
@@ -78,31 +120,39 @@ def normalize_spaces(s: str) -> str:
         - String with only whitespace returns an empty string.
         - Non-breaking spaces and other Unicode whitespace are treated as whitespace.
     """
-    return re.sub(r'\s+', ' ', s).strip()
+    # Printable ASCII has no whitespace other than ' ', so without a double
+    # space there is nothing to collapse beyond the ends.
+    if s.isascii() and s.isprintable() and '  ' not in s:
+        return s.strip()
+    return ' '.join(s.split())
 
-def normalize_unicode(s: str) -> str:
+def normalize_unicode(s: str, form: str = "NFKD") -> str:
     """Normalize Unicode characters to their canonical decomposed form.
 
-    Applies NFKD (Compatibility Decomposition) normalization, which decomposes
-    characters into their constituent parts and applies compatibility mappings.
-    Useful for handling accented characters and compatibility characters.
+    Applies NFKD (Compatibility Decomposition) normalization by default, which
+    decomposes characters into their constituent parts and applies compatibility
+    mappings. Useful for handling accented characters and compatibility characters.
+    Pass form="NFC" to keep composed, round-trippable characters instead.
 
     Args:
         s: The input string with potentially non-normalized Unicode characters.
+        form: The normalization form: "NFC", "NFKC", "NFD" or "NFKD".
 
     Returns:
-        The string with Unicode characters normalized to NFKD form.
+        The string with Unicode characters normalized to the requested form.
 
     Raises:
-        None
+        ValueError: If form is not a valid normalization form.
 
     Edge cases:
         - Empty string returns an empty string.
-        - ASCII-only strings are unchanged.
-        - Accented characters are decomposed into base character + combining marks.
-        - Some characters may be converted to different representations (e.g., ligatures).
+        - ASCII-only strings are unchanged and returned without normalizing.
+        - With NFKD, accented characters are decomposed into base character + combining marks.
+        - With NFKD/NFKC, some characters may be converted to different representations (e.g., ligatures).
     """
-    return unicodedata.normalize("NFKD", s)
+    if s.isascii() and form in _FORMS:
+        return s
+    return unicodedata.normalize(form, s)
 
 def clean_text(s: str) -> str:
     """Perform comprehensive text cleaning on a string.
@@ -127,9 +177,29 @@ def clean_text(s: str) -> str:
         - HTML entities are decoded before tag removal (e.g., &lt;tag&gt; becomes <tag> then removed).
         - The function calls remove_html, remove_emoji, normalize_unicode, and normalize_spaces internally.
     """
-    s = html.unescape(s)
+    if '&' in s:
+        s = _unescape(s)
     s = remove_html(s)
     s = remove_emoji(s)
     s = normalize_unicode(s)
     s = normalize_spaces(s)
     return s
+
+def clean_text_batch(strings) -> list:
+    """Perform comprehensive text cleaning on every string in an iterable.
+
+    Equivalent to calling clean_text on each item.
+
+    Args:
+        strings: An iterable of strings to clean.
+
+    Returns:
+        A list with each input cleaned, in input order.
+
+    Raises:
+        TypeError: If strings is not iterable.
+
+    Edge cases:
+        - Empty iterable returns an empty list.
+    """
+    return list(map(clean_text, strings))
@@ -1,3 +1,36 @@
+import re
+from functools import lru_cache
+from ._trie import _compile_trie
+
+# Below this many needles, repeated C-level substring searches beat even a
+# precompiled regex pass.
+_MANY_ITEMS = 256
+# Below this len(s) * len(items), the plain search is too cheap to be worth
+# hashing the needle set for a pattern lookup.
+_MANY_CHARS = 250_000
+# Needle sets seen once. A set is compiled only on its second sighting, so
+# one-off lists never pay for building a regex they would use a single time.
+_SEEN_NEEDLES = set()
+_SEEN_MAX = 32
+
+@lru_cache(maxsize=32)
+def _compile_needles(needles: frozenset) -> "re.Pattern":
+    """Compile a pattern matching any needle, cached on the needle set.
+
+    Keyed by a frozenset so the same needles in any order or container share
+    one pattern. The cache is small because every entry holds a large set.
+    """
+    return _compile_trie(needles)
+
+def _needle_pattern(needles: frozenset):
+    """Return the compiled pattern for a needle set seen before, else None."""
+    if needles in _SEEN_NEEDLES:
+        return _compile_needles(needles)
+    if len(_SEEN_NEEDLES) >= _SEEN_MAX:
+        _SEEN_NEEDLES.clear()
+    _SEEN_NEEDLES.add(needles)
+    return None
+
 def contains_any(s: str, items) -> bool:
     """Check if a string contains any of the given items.
 
@@ -19,7 +52,16 @@ def contains_any(s: str, items) -> bool:
         - Empty string only returns True if items contains empty string.
         - Case-sensitive substring matching.
         - Matching is performed using the 'in' operator.
+        - Sized collections of 256 or more items searched over a long string
+          are matched in a single pass with a compiled prefix-trie regex once
+          the same needle set has been seen before; first sightings and small
+          workloads use one search per item.
     """
+    if (hasattr(items, "__len__") and len(items) >= _MANY_ITEMS
+            and len(s) * len(items) >= _MANY_CHARS):
+        pattern = _needle_pattern(frozenset(items))
+        if pattern is not None:
+            return pattern.search(s) is not None
     return any(i in s for i in items)
 
 def contains_all(s: str, items) -> bool:
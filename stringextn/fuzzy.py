@@ -1,6 +1,13 @@
 from difflib import SequenceMatcher
+from functools import lru_cache
 
-def similarity(a: str, b: str) -> float:
+# Longest input scored without difflib's autojunk heuristic. Exact matching is
+# roughly quadratic on repetitive text (about 0.1s for two 1000-char strings
+# over a two-letter alphabet), so longer inputs keep the heuristic to bound cost.
+_EXACT_MAX_LEN = 1000
+
+@lru_cache(maxsize=8192)
+def similarity(a: str, b: str, score_cutoff: float = 0.0) -> float:
     """Calculate the similarity ratio between two strings.
 
     Computes a similarity score between 0 and 1 using SequenceMatcher from
@@ -10,10 +17,14 @@ def similarity(a: str, b: str) -> float:
     Args:
         a: The first string to compare.
         b: The second string to compare.
+        score_cutoff: Minimum score of interest. Scores below it are reported
+            as 0.0, which lets pairs whose lengths or character counts
+            alone rule them out skip the matching step entirely.
 
     Returns:
         A float between 0 and 1 representing the similarity ratio, rounded to
-        3 decimal places. 1.0 indicates identical strings, 0.0 indicates no similarity.
+        3 decimal places. 1.0 indicates identical strings, 0.0 indicates no similarity
+        or a score below score_cutoff.
 
     Raises:
         None
@@ -24,5 +35,52 @@ def similarity(a: str, b: str) -> float:
         - Case-sensitive comparison: 'abc' and 'ABC' are treated as different.
         - Whitespace is significant: leading/trailing spaces affect the result.
         - The function uses longest contiguous matching subsequences for comparison.
+        - difflib's autojunk heuristic is disabled for strings of up to 1000
+          characters, so frequent characters still count towards the score.
+          Longer inputs keep the heuristic to bound the cost; their scores
+          can drop sharply when a few characters dominate the text.
+        - The cutoff is compared against the rounded score.
+        - Strings with no character in common return 0.0 without matching.
+    """
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    if set(a).isdisjoint(b):
+        # No character in common, so there is nothing to match.
+        return 0.0
+    la, lb = len(a), len(b)
+    # At most every character of the shorter string can match.
+    if score_cutoff and round(2.0 * min(la, lb) / (la + lb), 3) < score_cutoff:
+        return 0.0
+    sm = SequenceMatcher(None, a, b, autojunk=max(la, lb) > _EXACT_MAX_LEN)
+    # quick_ratio() bounds ratio() from above by counting shared characters.
+    if score_cutoff and round(sm.quick_ratio(), 3) < score_cutoff:
+        return 0.0
+    score = round(sm.ratio(), 3)
+    return score if score >= score_cutoff else 0.0
+
+def similarity_batch(query: str, candidates, score_cutoff: float = 0.0) -> list:
+    """Calculate the similarity ratio between one string and many candidates.
+
+    Produces the same scores as calling similarity(query, candidate) for each
+    candidate, sharing its LRU cache, fast paths and score_cutoff prefilter.
+    Useful for ranking or threshold filtering a list of candidates.
+
+    Args:
+        query: The string every candidate is compared with.
+        candidates: An iterable of strings to score against query.
+        score_cutoff: Minimum score of interest; lower scores are reported as 0.0.
+
+    Returns:
+        A list of floats between 0 and 1, one per candidate, in input order.
+
+    Raises:
+        TypeError: If candidates is not iterable.
+
+    Edge cases:
+        - Empty iterable returns an empty list.
+        - Scores are those of similarity(query, candidate); since the ratio is
+          not always symmetric, argument order matches that call.
     """
-    return round(SequenceMatcher(None, a, b).ratio(), 3)
+    return [similarity(query, c, score_cutoff) for c in candidates]
@@ -1,11 +1,23 @@
 import re
+from functools import lru_cache
+from ._trie import _compile_trie
+
+@lru_cache(maxsize=256)
+def _compile_keys(keys: frozenset) -> "re.Pattern":
+    """Compile a pattern matching any key, preferring the longest at each position.
+
+    Cached on the key set so repeated calls with the same keys, in any order,
+    skip both the trie build and the regex compilation.
+    """
+    return _compile_trie(keys)
 
 def multi_replace(s: str, mapping: dict) -> str:
     """Replace multiple substrings in a string using a mapping dictionary.
 
     Performs simultaneous replacement of multiple substrings based on the
-    provided mapping dictionary. Uses compiled regex pattern for efficient
-    substitution. All keys are escaped to be treated as literal strings.
+    provided mapping dictionary. The keys are compiled into a single
+    prefix-factored regex so the input is scanned once regardless of how many
+    keys there are. All keys are escaped to be treated as literal strings.
 
     Args:
         s: The input string to perform replacements on.
@@ -20,11 +32,29 @@ def multi_replace(s: str, mapping: dict) -> str:
 
     Edge cases:
         - Empty mapping dictionary returns the original string unchanged.
+        - A single-key mapping is handled by str.replace without a regex.
+        - Single-character keys with str values over ASCII input are handled
+          by str.translate.
         - Empty string returns an empty string.
-        - Empty keys in mapping are ignored by the regex pattern.
-        - Overlapping matches are not replaced multiple times; first match wins.
+        - Empty keys in mapping are ignored.
+        - Overlapping matches are not replaced multiple times; the leftmost match wins.
+        - When several keys match at the same position, the longest key wins,
+          independent of the mapping's insertion order.
         - All special regex characters in keys are escaped automatically.
-        - Order of replacements is determined by the order keys appear in the pattern.
     """
-    pattern = re.compile("|".join(map(re.escape, mapping.keys())))
-    return pattern.sub(lambda m: mapping[m.group(0)], s)
+    if "" in mapping:
+        # An empty key would match between every character; ignore it.
+        mapping = {key: value for key, value in mapping.items() if key}
+    if not mapping:
+        return s
+    if len(mapping) == 1:
+        (key, value), = mapping.items()
+        return s.replace(key, value)
+    if s.isascii() and all(len(key) == 1 and isinstance(value, str)
+                           for key, value in mapping.items()):
+        # Single-character keys cannot overlap, so one translate pass is exact.
+        # maketrans would accept int values as code points, so those stay on
+        # the regex path and raise TypeError there.
+        return s.translate(str.maketrans(mapping))
+    pattern = _compile_keys(frozenset(mapping))
+    return pattern.sub(lambda m: mapping[m[0]], s)
@@ -45,4 +45,7 @@ def mask_phone(phone: str) -> str:
         - No validation is performed on phone format; any string is accepted.
         - Special characters and spaces are preserved (treated as regular characters).
     """
-    return "*" * (len(phone) - 4) + phone[-4:]
+    hidden = len(phone) - 4
+    if hidden <= 0:
+        return phone
+    return "*" * hidden + phone[-4:]
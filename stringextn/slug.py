@@ -1,6 +1,18 @@
 import re
+from functools import lru_cache
 from .clean import clean_text
 
+_NONALNUM = re.compile(r'[^a-z0-9]+')
+# Combining diacritical marks left behind by clean_text's NFKD normalization.
+_MARKS = re.compile(r'[\u0300-\u036f]+')
+# bytes.translate table keeping [a-z0-9], lowercasing [A-Z] and mapping every
+# other byte to a space.
+_SLUG_TABLE = bytes(
+    c if (48 <= c <= 57 or 97 <= c <= 122) else c + 32 if 65 <= c <= 90 else 32
+    for c in range(256)
+)
+
+@lru_cache(maxsize=4096)
 def slugify(s: str) -> str:
     """Convert a string to a URL-friendly slug format.
 
@@ -25,9 +37,38 @@ def slugify(s: str) -> str:
         - Consecutive special characters are collapsed into a single hyphen.
         - Leading/trailing hyphens are removed via strip.
         - HTML tags and emoji are removed by clean_text.
-        - Unicode characters are normalized before conversion.
+        - Unicode characters are normalized before conversion, and accents are
+          dropped (e.g. "résumé" -> "resume").
         - Spaces are converted to hyphens as part of the non-alphanumeric replacement.
     """
-    s = clean_text(s).lower()
-    s = re.sub(r'[^a-z0-9]+', '-', s)
+    s = clean_text(s)
+    if not s.isascii():
+        # Dropping the marks folds accented Latin text down to ASCII.
+        s = _MARKS.sub('', s.lower())
+    if s.isascii():
+        # The table also lowercases; split() collapses the separator runs and
+        # trims both ends in one C call.
+        return b"-".join(s.encode("ascii").translate(_SLUG_TABLE).split()).decode("ascii")
+    s = _NONALNUM.sub('-', s)
     return s.strip('-')
+
+def slugify_batch(strings) -> list:
+    """Convert every string in an iterable to a URL-friendly slug.
+
+    Equivalent to calling slugify on each item, and shares its LRU cache, so
+    duplicate titles in a batch are only cleaned once.
+
+    Args:
+        strings: An iterable of strings to convert to slugs.
+
+    Returns:
+        A list with each input converted to a slug, in input order.
+
+    Raises:
+        TypeError: If strings is not iterable.
+
+    Edge cases:
+        - Empty iterable returns an empty list.
+        - Duplicate inputs produce identical slugs.
+    """
+    return list(map(slugify, strings))
@@ -9,7 +9,7 @@ Unicode characters, and numeric strings.
 """
 
 import pytest
-from stringextn.cases import to_snake, to_camel, to_pascal, to_kebab
+from stringextn.cases import to_snake, to_camel, to_pascal, to_kebab, to_snake_batch
 
 
 class TestToSnake:
@@ -79,6 +79,27 @@ class TestToSnake:
         """Test mixed case with numbers"""
         assert to_snake("getHTTP2Response") == "get_http2_response"
 
+    def test_adjacent_capitalized_words(self):
+        """Test that back-to-back capitalized words each get one underscore"""
+        assert to_snake("parseXMLAndJSONData") == "parse_xml_and_json_data"
+
+
+class TestToSnakeBatch:
+    """Test cases for to_snake_batch function"""
+
+    def test_matches_scalar_to_snake(self):
+        """Test that batch results equal per-item to_snake results"""
+        items = ["camelCase", "HTTPResponse", "hello world", "", "getHTTP2Response"]
+        assert to_snake_batch(items) == [to_snake(s) for s in items]
+
+    def test_accepts_generator(self):
+        """Test that any iterable is accepted"""
+        assert to_snake_batch(s for s in ["myVar", "Other"]) == ["my_var", "other"]
+
+    def test_empty_iterable(self):
+        """Test empty iterable"""
+        assert to_snake_batch([]) == []
+
 
 class TestToCamel:
     """Test cases for to_camel function"""
@@ -130,8 +151,8 @@ class TestToCamel:
     def test_leading_separator(self):
         """Test with leading separator.
         
-        Edge case: Leading '_' creates an empty first element that becomes
-        capitalized through title() processing.
+        Edge case: Leading '_' creates an empty first element, so 'hello' is
+        capitalized like any later word.
         """
         assert to_camel("_hello_world") == "HelloWorld"
 
@@ -143,7 +164,7 @@ class TestToCamel:
         """Test multiple consecutive separators.
         
         Edge case: 'hello__world' splits into ['hello', '', 'world']. Empty strings
-        title-case to '', so consecutive separators result in single separator.
+        capitalize to '', so consecutive separators result in single separator.
         """
         assert to_camel("hello__world") == "helloWorld"
 
@@ -381,3 +402,11 @@ class TestEdgeCases:
         """
         assert to_snake("getAPI") == "get_api"
         assert to_pascal("get_api") == "GetApi"
+
+    def test_digit_inside_word_keeps_following_letter_lowercase(self):
+        """Test that a letter after a digit is not treated as a word start.
+
+        Edge case: only separators start a new word, so 'v2api' stays one word.
+        """
+        assert to_camel("get_v2api") == "getV2api"
+        assert to_pascal("get_v2api") == "GetV2api"
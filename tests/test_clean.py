@@ -16,6 +16,7 @@ from stringextn.clean import (
     normalize_spaces,
     normalize_unicode,
     clean_text,
+    clean_text_batch,
 )
 
 
@@ -54,6 +55,16 @@ class TestRemoveHtml:
         """Test removal of HTML comments"""
         assert remove_html("Hello<!-- comment -->World") == "HelloWorld"
 
+    def test_html_comment_containing_angle_bracket(self):
+        """Test that a comment containing '>' or a newline is removed whole"""
+        assert remove_html("a<!-- x > y\n z -->b") == "ab"
+
+    def test_unterminated_comment_runs_to_end(self):
+        """Test that a comment with no closing '-->' removes the rest of input"""
+        # Edge case: matches HTML parsers and keeps the scan linear.
+        assert remove_html("a<b>c<!-- d\ne") == "ac"
+        assert remove_html("text\n" + "<!--x\n" * 20000) == "text\n"
+
     def test_script_tag(self):
         """Test removal of script tags (content inside may remain).
         
@@ -303,6 +314,16 @@ class TestNormalizeUnicode:
         result = normalize_unicode("こんにちは")
         assert isinstance(result, str)
 
+    def test_nfc_form_keeps_composed_characters(self):
+        """Test that form="NFC" composes instead of decomposing"""
+        assert normalize_unicode("e\u0301", form="NFC") == "é"
+        assert normalize_unicode("ﬁ", form="NFC") == "ﬁ"
+
+    def test_invalid_form_raises(self):
+        """Test that an unknown form raises ValueError even for ASCII input"""
+        with pytest.raises(ValueError):
+            normalize_unicode("abc", form="XYZ")
+
 
 class TestCleanText:
     """Test cases for clean_text function (comprehensive cleaning)"""
@@ -465,6 +486,19 @@ class TestCleanText:
         assert "$100" in result
 
 
+class TestCleanTextBatch:
+    """Test cases for clean_text_batch function"""
+
+    def test_matches_scalar_clean_text(self):
+        """Test that batch results equal per-item clean_text results"""
+        items = ["<p>Hello &amp; goodbye!</p>", "plain", "café 😀  ok", ""]
+        assert clean_text_batch(items) == [clean_text(s) for s in items]
+
+    def test_empty_iterable(self):
+        """Test empty iterable"""
+        assert clean_text_batch([]) == []
+
+
 class TestIntegration:
     """Integration tests for multiple functions"""
 
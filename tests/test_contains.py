@@ -177,6 +177,26 @@ class TestContainsAny:
         items = ["x" + str(i) for i in range(100)]
         assert contains_any("hello world", items) is False
 
+    def test_many_items_match_inside_other_needle_prefix(self):
+        """Test many items where the match shares a prefix with other needles"""
+        # Edge case: repeated large needle sets over long text take the trie path.
+        text = "filler " * 200 + "hello world"
+        items = ["worlds", "worldwide"] + ["x" + str(i) for i in range(300)] + ["world"]
+        for _ in range(2):
+            assert contains_any(text, items) is True
+            assert contains_any("filler " * 200, set(items) | {""}) is True
+
+    def test_many_items_any_order_or_container(self):
+        """Test large needle sets give the same answer in any order"""
+        # Edge case: list, reversed list and set of the same needles agree,
+        # both on first sighting and once the set's pattern is compiled.
+        text = "filler " * 200
+        items = ["x" + str(i) for i in range(300)] + ["world"]
+        for _ in range(2):
+            for needles in (items, items[::-1], set(items), tuple(items)):
+                assert contains_any(text + "hello world", needles) is True
+                assert contains_any(text + "hello", needles) is False
+
     def test_empty_string_in_items(self):
         """Test with empty string in items list"""
         # Edge case: Empty string is always contained in any string.
@@ -5,7 +5,7 @@ real-world scenarios using difflib-based ratios.
 """
 
 import pytest
-from stringextn.fuzzy import similarity
+from stringextn.fuzzy import similarity, similarity_batch
 
 
 class TestSimilarityBasic:
@@ -372,6 +372,21 @@ class TestSimilarityLongStrings:
         result = similarity(str1, str2)
         assert 0.99 < result < 1.0
 
+    def test_long_sentences_one_word_diff(self):
+        """Test long natural-language strings differing by one word"""
+        # Edge case: common characters must not be discarded as junk in 200+ char inputs.
+        str1 = "the quick brown fox " * 20
+        str2 = "the quick brown cat " * 20
+        assert similarity(str1, str2) > 0.8
+
+    def test_very_long_repetitive_strings_finish_quickly(self):
+        """Test that inputs above 1000 characters keep difflib's autojunk heuristic"""
+        # Edge case: exact matching on long low-entropy text would take seconds.
+        str1 = "ab" * 5000
+        str2 = "ba" * 5000
+        result = similarity(str1, str2)
+        assert 0.0 <= result <= 1.0
+
 
 class TestSimilarityRealWorldScenarios:
     """Real-world usage scenarios"""
@@ -655,6 +670,20 @@ class TestSimilarityCommonCases:
         assert similarities[1] >= threshold
         assert similarities[2] < threshold
 
+    def test_score_cutoff(self):
+        """Test that scores below score_cutoff are reported as 0.0"""
+        # Edge case: lengths alone rule out "a" vs "bbbbbbbbb" at a 0.5 cutoff.
+        assert similarity("a", "bbbbbbbbb", score_cutoff=0.5) == 0.0
+        assert similarity("test", "xyz", score_cutoff=0.75) == 0.0
+        assert similarity("hello", "hallo", score_cutoff=0.75) == similarity("hello", "hallo")
+
+    def test_score_cutoff_character_counts(self):
+        """Test score_cutoff when lengths match but characters differ"""
+        # Edge case: no shared characters, and shared characters in another order.
+        assert similarity("abcd", "wxyz", score_cutoff=0.5) == 0.0
+        assert similarity("abcd", "dcba", score_cutoff=0.5) == 0.0
+        assert similarity("abcd", "abdc", score_cutoff=0.5) == similarity("abcd", "abdc")
+
     def test_ranking_by_similarity(self):
         """Test ranking candidates by similarity"""
         # Best match should rank first by highest similarity.
@@ -665,3 +694,23 @@ class TestSimilarityCommonCases:
         sorted_sims = sorted(similarities, key=lambda x: x[1], reverse=True)
         # Best match should be first
         assert sorted_sims[0][0] == "python"
+
+
+class TestSimilarityBatch:
+    """Test cases for similarity_batch function"""
+
+    def test_matches_scalar_similarity(self):
+        """Test that batch scores equal per-candidate similarity scores"""
+        # Ranking candidates should give the same order as scalar calls.
+        candidates = ["python", "pyton", "java", "pytho", "c++", ""]
+        assert similarity_batch("python", candidates) == [similarity("python", c) for c in candidates]
+
+    def test_score_cutoff_applies_to_each_candidate(self):
+        """Test that score_cutoff zeroes out weak candidates"""
+        # Dissimilar candidates fall below the cutoff and report 0.0.
+        assert similarity_batch("hello", ["hallo", "xyz"], score_cutoff=0.75) == [0.8, 0.0]
+
+    def test_empty_candidates(self):
+        """Test empty candidate iterable"""
+        # No candidates yields an empty list.
+        assert similarity_batch("hello", []) == []
@@ -78,6 +78,12 @@ class TestMultiReplaceBasic:
         # The pattern is "ab|bc", so "ab" matches first
         assert result in ["XYc", "aZW"]  # Depending on implementation
 
+    def test_prefix_keys_longest_match_wins(self):
+        """Test that the longest key wins when keys share a prefix"""
+        # Edge case: result must not depend on the mapping's insertion order.
+        assert multi_replace("cart car", {"car": "X", "cart": "Y"}) == "Y X"
+        assert multi_replace("cart car", {"cart": "Y", "car": "X"}) == "Y X"
+
     def test_entire_string_replacement(self):
         """Test replacing entire string"""
         # Full string replacement should work.
@@ -96,6 +102,18 @@ class TestMultiReplaceBasic:
         result = multi_replace("hello world", {" ": "_"})
         assert result == "hello_world"
 
+    def test_single_character_keys_swap(self):
+        """Test single-character keys are replaced simultaneously"""
+        # Edge case: swapped characters must not cascade into each other.
+        result = multi_replace("abba cab", {"a": "b", "b": "a", " ": ""})
+        assert result == "baabcba"
+
+    def test_single_character_keys_non_str_value_raises(self):
+        """Test that a non-str value raises TypeError for ASCII input"""
+        # Edge case: int values must not be treated as code points.
+        with pytest.raises(TypeError):
+            multi_replace("abc", {"a": 1, "b": "x"})
+
 
 class TestMultiReplaceWithNumbers:
     """Test cases with numbers"""
@@ -396,8 +414,8 @@ class TestMultiReplaceLongStrings:
         mapping = {str(i): f"[{i}]" for i in range(10)}
         text = "".join(str(i % 10) for i in range(100))
         result = multi_replace(text, mapping)
-        # Numbers should be replaced with bracketed versions
-        assert "[" in result and "]" in result
+        # Every digit should be replaced with its bracketed version
+        assert result == "".join(f"[{d}]" for d in text)
 
     def test_large_replacement_mapping(self):
         """Test with large replacement mapping"""
@@ -405,8 +423,7 @@ class TestMultiReplaceLongStrings:
         mapping = {f"word{i}": f"replacement{i}" for i in range(100)}
         text = "word0 word1 word2 word99"
         result = multi_replace(text, mapping)
-        assert "word0" not in result
-        assert "replacement0" in result
+        assert result == "replacement0 replacement1 replacement2 replacement99"
 
 
 class TestMultiReplaceRealWorldScenarios:
@@ -582,6 +599,12 @@ class TestMultiReplaceEdgeCases:
         # Empty string matches everywhere - might produce XhXeXlXlXoX or just "hello"
         assert isinstance(result, str)
 
+    def test_empty_key_ignored_with_other_keys(self):
+        """Test that an empty key does not affect the other keys"""
+        # Edge case: only the non-empty keys are replaced.
+        assert multi_replace("hello", {"": "X"}) == "hello"
+        assert multi_replace("hello", {"": "X", "l": "L"}) == "heLLo"
+
     def test_self_replacement(self):
         """Test key maps to itself"""
         # Self-mapping should leave text unchanged.
@@ -323,13 +323,9 @@ class TestMaskPhoneEdgeCases:
 
     def test_phone_less_than_4_chars(self):
         """Test phone shorter than 4 characters"""
-        # Edge case: length < 4 should still return a string.
+        # Edge case: length < 4 is returned unchanged.
         result = mask_phone("123")
-        # All characters are masked except last 4 (which don't exist)
-        # So: ("*" * (3 - 4)) + "123" = "" + "123" = ""? or just "123"?
-        # Actually: "*" * max(0, len - 4) + last_4
-        # For length 3: "*" * (3-4) would be negative, but should handle it
-        assert isinstance(result, str)
+        assert result == "123"
 
     def test_phone_exactly_4_chars_edge(self):
         """Test phone with exactly 4 characters"""
@@ -339,10 +335,9 @@ class TestMaskPhoneEdgeCases:
 
     def test_single_digit_phone(self):
         """Test single digit phone"""
-        # Edge case: single character should return a string.
+        # Edge case: single character is returned unchanged.
         result = mask_phone("5")
-        # Should be masked but preserving last 4 (which don't exist)
-        assert isinstance(result, str)
+        assert result == "5"
 
     def test_empty_string_phone(self):
         """Test empty string phone"""
@@ -675,15 +670,9 @@ class TestMaskEdgeCasesExtended:
 
     def test_email_at_symbol_multiple(self):
         """Test email handling (should only have one @ by design)"""
-        # Edge case: invalid emails may raise ValueError.
-        # This might fail if email has multiple @, but the function assumes valid email
-        try:
-            result = mask_email("user@mid@example.com")
-            # If it works, last @ is used
-            assert "***@" in result
-        except ValueError:
-            # Or it might raise an error for invalid email
-            pass
+        # Edge case: multiple @ symbols raise ValueError, as documented.
+        with pytest.raises(ValueError):
+            mask_email("user@mid@example.com")
 
     def test_phone_parentheses_unbalanced(self):
         """Test phone with unbalanced parentheses"""
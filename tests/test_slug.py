@@ -5,7 +5,7 @@ HTML cleaning, edge cases, and real-world scenarios.
 """
 
 import pytest
-from stringextn.slug import slugify
+from stringextn.slug import slugify, slugify_batch
 
 
 class TestSlugifyBasic:
@@ -250,6 +250,11 @@ class TestSlugifyUnicode:
         result = slugify("café latté")
         assert "-" in result or "cafe" in result
 
+    def test_accents_dropped_inside_words(self):
+        """Test accented letters inside a word don't split it"""
+        # Edge case: combining marks from NFKD must not become hyphens.
+        assert slugify("Crème Brûlée résumé") == "creme-brulee-resume"
+
     def test_chinese_characters(self):
         """Test Chinese characters"""
         # Non-latin characters are stripped by alphanumeric filter.
@@ -799,3 +804,23 @@ class TestSlugifyPerformance:
         text = "café " * 1000
         result = slugify(text)
         assert isinstance(result, str)
+
+
+class TestSlugifyBatch:
+    """Test cases for slugify_batch function"""
+
+    def test_matches_scalar_slugify(self):
+        """Test that batch results equal per-item slugify results"""
+        # Mixed ASCII, HTML and Unicode inputs exercise every slugify path.
+        items = ["Hello World", "<p>café latté</p>", "😀 hi", "", "a--b"]
+        assert slugify_batch(items) == [slugify(s) for s in items]
+
+    def test_accepts_generator(self):
+        """Test that any iterable is accepted"""
+        # Generators are consumed once and returned as a list.
+        assert slugify_batch(s for s in ["A B", "C"]) == ["a-b", "c"]
+
+    def test_empty_iterable(self):
+        """Test empty iterable"""
+        # No inputs yields an empty list.
+        assert slugify_batch([]) == []